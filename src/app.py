@@ -1,34 +1,20 @@
 """Main Textual application for fftpeg."""
 
+import os
 from pathlib import Path
-from textual.app import App, ComposeResult
+from textual.app import App
 from textual.binding import Binding
-from textual.containers import Container, Vertical
-from textual.widgets import Header, Footer, Static
-from .screens.main_menu import MainMenuScreen
 
 
 class FFTpegApp(App):
     """The main fftpeg TUI application."""
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    #info-bar {
-        dock: bottom;
-        height: 1;
-        background: $accent;
-        color: $text;
-        padding: 0 1;
-    }
-    """
-
-    BINDINGS = [
+    CSS_PATH = "app.tcss"
+
+    BINDINGS = (
         Binding("q", "quit", "Quit", priority=True),
         Binding("question_mark", "help", "Help"),
-    ]
+    )
 
     def __init__(self, start_path: Path):
         """Initialize the application.
@@ -38,11 +24,15 @@ class FFTpegApp(App):
         """
         super().__init__()
         self.start_path = start_path
+        # Stringify the path once; sub_title and anything else that needs
+        # the display form reuse it instead of re-invoking Path.__str__.
+        self._start_path_str = os.fspath(start_path)
         self.title = "fftpeg - Terminal FFmpeg"
-        self.sub_title = f"📁 {start_path}"
+        self.sub_title = f"📁 {self._start_path_str}"
 
     def on_mount(self) -> None:
         """Called when app starts."""
+        from .screens.main_menu import MainMenuScreen
         self.push_screen(MainMenuScreen(self.start_path))
 
     def action_help(self) -> None:
@@ -1,27 +1,354 @@
 """CLI commands for fftpeg operations."""
 
+import os
+import shlex
+import shutil
+import subprocess
 import sys
+import threading
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from .utils.downloader import VideoDownloader
+import ffmpeg
+from rich.progress import (BarColumn, Progress, TaskProgressColumn,
+                           TextColumn, TimeRemainingColumn)
+
 from .utils.database import Database
 from .utils.symlink_manager import SymlinkManager
 from .config.settings import Config
 
 
+# Precomputed reciprocal: multiply instead of dividing at every size report
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Progress bar layout shared by every ffmpeg invocation; built once so
+# each run reuses the same column objects
+_PROGRESS_COLUMNS = (
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TaskProgressColumn(),
+    TimeRemainingColumn(),
+)
+
+# Source codec names (as reported by ffprobe) that each audio output
+# format can accept via stream copy instead of a re-encode
+AUDIO_COPY_CODECS = {
+    'mp3': 'mp3',
+    'm4a': 'aac',
+    'flac': 'flac',
+    'wav': 'pcm_s16le',
+}
+
+# Encoder to use for each audio output format when a re-encode is needed
+AUDIO_ENCODERS = {
+    'mp3': 'libmp3lame',
+    'm4a': 'aac',
+    'flac': 'flac',
+    'wav': 'pcm_s16le',
+}
+
+# Containers in the MP4 family, where relocating the moov atom to the
+# front (-movflags +faststart) lets players start before the download
+# finishes; WebM/Matroska stream-write natively and need nothing
+_FASTSTART_SUFFIXES = {'.mp4', '.m4a', '.mov'}
+
+# NVENC equivalents for the libx264 preset names accepted by the CLI
+NVENC_PRESET_MAP = {
+    'ultrafast': 'p1',
+    'faster': 'p2',
+    'fast': 'p3',
+    'medium': 'p4',
+    'slow': 'p6',
+    'veryslow': 'p7',
+}
+
+
+def _mux_opts(output_path: Path) -> dict:
+    """Get container-specific muxer options for an output path.
+
+    Args:
+        output_path: Destination file
+
+    Returns:
+        Keyword options to merge into ffmpeg.output (possibly empty)
+    """
+    if output_path.suffix.lower() in _FASTSTART_SUFFIXES:
+        return {'movflags': '+faststart'}
+    return {}
+
+
+def _parse_timestamp(value: str) -> float:
+    """Parse an HH:MM:SS, MM:SS, or plain-seconds timestamp into seconds.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Timestamp in seconds
+    """
+    seconds = 0.0
+    for part in value.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _resolve_and_stat(input_file: str):
+    """Expand an input path and stat it in a single pass.
+
+    Replaces the expanduser + resolve + exists + stat sequence, which
+    walked the filesystem several times for one file; symlinks are left
+    for ffmpeg to follow.
+
+    Args:
+        input_file: Raw input path from the command line
+
+    Returns:
+        Tuple of (Path, stat result), the stat being None if the file
+        does not exist
+    """
+    path = Path(os.path.expanduser(input_file))
+    try:
+        return path, os.stat(path)
+    except OSError:
+        return path, None
+
+
+@lru_cache(maxsize=1)
+def _shared_db() -> Database:
+    """Process-wide Database handle, opened once."""
+    return Database()
+
+
+@lru_cache(maxsize=1)
+def _shared_config() -> Config:
+    """Process-wide Config, loaded once."""
+    return Config()
+
+
+@lru_cache(maxsize=1)
+def _shared_symlink_manager() -> SymlinkManager:
+    """Process-wide SymlinkManager rooted at the configured base path."""
+    org_paths = _shared_config().get_organization_paths()
+    return SymlinkManager(org_paths['base'].parent)
+
+
+def _cached_probe(path: Path) -> Optional[dict]:
+    """Run ffmpeg.probe with a Database-backed cache.
+
+    Each ffprobe call costs a subprocess launch; the parsed JSON is
+    stored keyed by (path, mtime, size) so repeated operations on an
+    unchanged file reuse it, and one probe here serves both the
+    duration and codec lookups below.
+
+    Args:
+        path: Path to the media file
+
+    Returns:
+        Probe dict, or None if the file could not be probed
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    db = _shared_db()
+    probe = db.get_probe(path, st.st_mtime, st.st_size)
+    if probe is not None:
+        return probe
+
+    try:
+        probe = ffmpeg.probe(str(path))
+    except (ffmpeg.Error, OSError):
+        return None
+
+    db.set_probe(path, st.st_mtime, st.st_size, probe)
+    return probe
+
+
+def _probe_duration(path: Path) -> Optional[float]:
+    """Probe a media file's duration in seconds.
+
+    Args:
+        path: Path to the media file
+
+    Returns:
+        Duration in seconds, or None if it could not be determined
+    """
+    probe = _cached_probe(path)
+    try:
+        return float(probe['format']['duration'])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def _source_audio_codec(path: Path) -> Optional[str]:
+    """Probe the codec of a file's first audio stream.
+
+    Args:
+        path: Path to the media file
+
+    Returns:
+        Codec name (e.g., 'aac'), or None if it could not be determined
+    """
+    probe = _cached_probe(path)
+    if probe:
+        for stream in probe.get('streams', ()):
+            if stream.get('codec_type') == 'audio':
+                return stream.get('codec_name')
+    return None
+
+
+# Global flags every invocation needs for the progress-bar protocol
+_PROGRESS_ARGS = ('-progress', 'pipe:1', '-nostats', '-loglevel', 'error')
+
+
+def _run_ffmpeg_argv(argv, duration: Optional[float] = None) -> None:
+    """Execute a fully-built ffmpeg argv while rendering a progress bar.
+
+    Expects _PROGRESS_ARGS to already be part of argv; parses the
+    out_time_us counter from stdout to drive a percentage bar sized by
+    the expected output duration.
+
+    Args:
+        argv: Complete ffmpeg command line, starting with 'ffmpeg'
+        duration: Expected output duration in seconds (None = indeterminate)
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with a non-zero status
+    """
+    print(f"\n▶ Running: {shlex.join(argv)}")
+
+    proc = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    # Drain stderr on a side thread so the pipe can never fill up and
+    # stall ffmpeg mid-encode; keep only the tail for error reporting
+    # instead of buffering the whole log in memory.
+    stderr_tail = deque(maxlen=64)
+
+    def _drain_stderr():
+        for line in proc.stderr:
+            stderr_tail.append(line)
+
+    reader = threading.Thread(target=_drain_stderr, daemon=True)
+    reader.start()
+
+    with Progress(*_PROGRESS_COLUMNS) as progress:
+        task = progress.add_task("Processing", total=duration)
+
+        for raw_line in proc.stdout:
+            key, _, value = raw_line.decode('utf-8', 'replace').strip().partition('=')
+            if key == 'out_time_us' and duration and value.isdigit():
+                progress.update(task, completed=min(int(value) / 1e6, duration))
+            elif key == 'progress' and value == 'end' and duration:
+                progress.update(task, completed=duration)
+
+    reader.join()
+    if proc.wait() != 0:
+        raise ffmpeg.Error('ffmpeg', None, b''.join(stderr_tail))
+
+
+def _run_ffmpeg(stream, duration: Optional[float] = None) -> None:
+    """Compile and run an ffmpeg-python stream with a progress bar.
+
+    The stream is compiled to argv exactly once: the same list is
+    echoed to the user and handed to subprocess directly, rather than
+    joining/re-splitting a command string and letting run_async compile
+    a second time internally.
+
+    Args:
+        stream: ffmpeg-python output stream to execute
+        duration: Expected output duration in seconds (None = indeterminate)
+
+    Raises:
+        ffmpeg.Error: If ffmpeg exits with a non-zero status
+    """
+    argv = ffmpeg.compile(stream.global_args(*_PROGRESS_ARGS),
+                          overwrite_output=True)
+    _run_ffmpeg_argv(argv, duration)
+
+
+@lru_cache(maxsize=1)
+def _x264_asm_params() -> str:
+    """Get an x264 asm override for CPUs where AVX2 kernels are slower.
+
+    x264's AVX2/BMI2 paths underperform the SSE ones on AMD Zen 1/Zen 2
+    (family 23), so cap the instruction set there. Everywhere else the
+    full instruction set stays enabled.
+
+    Returns:
+        x264-params fragment, or an empty string when no override applies
+    """
+    try:
+        with open('/proc/cpuinfo') as f:
+            cpuinfo = f.read()
+    except OSError:
+        return ''
+
+    if 'AuthenticAMD' in cpuinfo and 'cpu family\t: 23' in cpuinfo:
+        return 'asm=mmx2,sse2,ssse3,sse4,avx'
+    return ''
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """Pick the best usable hardware H.264 encoder, once per process.
+
+    Prefers NVENC (needs an NVIDIA driver), then Intel QSV (needs a DRM
+    render node). VAAPI is deliberately not attempted: it needs a device
+    and hwupload filter pipeline that does not fit these simple calls.
+
+    Returns:
+        Encoder name ('h264_nvenc' or 'h264_qsv'), or None for software
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except OSError:
+        return None
+
+    encoders = result.stdout
+
+    if 'h264_nvenc' in encoders and shutil.which('nvidia-smi') is not None:
+        return 'h264_nvenc'
+    if 'h264_qsv' in encoders and os.path.exists('/dev/dri'):
+        return 'h264_qsv'
+    return None
+
+
 class CLI:
     """Command-line interface for fftpeg operations."""
 
     def __init__(self):
-        """Initialize CLI with necessary components."""
-        self.config = Config()
-        self.db = Database()
+        """Initialize CLI with the process-wide shared components.
 
-        org_paths = self.config.get_organization_paths()
-        base_path = org_paths['base'].parent
-        self.symlink_manager = SymlinkManager(base_path)
-        self.downloader = VideoDownloader(self.config, self.db, self.symlink_manager)
+        Config load, sqlite open, and directory creation happen once
+        per process no matter how many CLI instances the TUI screens
+        construct.
+        """
+        self.config = _shared_config()
+        self.db = _shared_db()
+        self.symlink_manager = _shared_symlink_manager()
+        self._downloader = None
+
+    @property
+    def downloader(self):
+        """Downloader instance, constructed on first use.
+
+        Importing VideoDownloader pulls in yt-dlp, which is by far the
+        slowest import in the tree; one-shot convert/compress/trim
+        invocations never pay for it.
+        """
+        if self._downloader is None:
+            from .utils.downloader import VideoDownloader
+            self._downloader = VideoDownloader(self.config, self.db,
+                                               self.symlink_manager)
+        return self._downloader
 
     def pull(self, url: str, tags: Optional[str] = None, preview: bool = False) -> int:
         """Pull/download video from URL.
@@ -65,7 +392,7 @@ class CLI:
             print(f"  File:   {result['filepath'].name}")
             print(f"  Source: {result['source']}")
             print(f"  Tags:   {', '.join(result['tags'])}")
-            print(f"  Size:   {result['metadata']['size'] / (1024*1024):.1f} MB")
+            print(f"  Size:   {result['metadata']['size'] * _INV_MB:.1f} MB")
             print(f"\n  Organized in:")
             print(f"    • downloads/")
             print(f"    • by-source/{result['source']}/")
@@ -99,33 +426,33 @@ class CLI:
         Returns:
             Exit code (0 for success)
         """
-        import ffmpeg
-
-        input_path = Path(input_file).expanduser().resolve()
-        output_path = Path(output_file).expanduser().resolve()
+        input_path, input_stat = _resolve_and_stat(input_file)
+        output_path = Path(output_file).expanduser()
 
-        if not input_path.exists():
+        if input_stat is None:
             print(f"✗ Error: Input file not found: {input_file}", file=sys.stderr)
             return 1
 
         print(f"🎬 Convert: {input_path.name} → {output_path.name}")
 
         try:
-            stream = ffmpeg.input(str(input_path))
-
             if codec:
-                stream = ffmpeg.output(stream, str(output_path), vcodec=codec)
+                stream = ffmpeg.input(str(input_path))
+                stream = ffmpeg.output(stream, str(output_path), vcodec=codec,
+                                       **_mux_opts(output_path))
+                _run_ffmpeg(stream, _probe_duration(input_path))
             else:
-                # Copy streams without re-encoding
-                stream = ffmpeg.output(stream, str(output_path), codec='copy')
-
-            # Show ffmpeg command
-            cmd = ' '.join(ffmpeg.compile(stream))
-            print(f"\n▶ Running: ffmpeg {cmd.split('ffmpeg')[1] if 'ffmpeg' in cmd else cmd}")
-
-            ffmpeg.run(stream, overwrite_output=True)
-
-            output_size = output_path.stat().st_size / (1024*1024)
+                # Copy streams without re-encoding; the argv is fixed,
+                # so build it directly instead of going through
+                # ffmpeg-python's graph builder and compiler
+                argv = ['ffmpeg', *_PROGRESS_ARGS, '-y',
+                        '-i', str(input_path), '-c', 'copy']
+                if output_path.suffix.lower() in _FASTSTART_SUFFIXES:
+                    argv += ['-movflags', '+faststart']
+                argv.append(str(output_path))
+                _run_ffmpeg_argv(argv, _probe_duration(input_path))
+
+            output_size = output_path.stat().st_size * _INV_MB
             print(f"\n✓ Conversion complete!")
             print(f"  Output: {output_path}")
             print(f"  Size:   {output_size:.1f} MB")
@@ -139,23 +466,23 @@ class CLI:
             return 1
 
     def compress(self, input_file: str, output_file: Optional[str] = None,
-                 crf: int = 23, preset: str = "medium") -> int:
+                 crf: int = 23, preset: str = "faster", hw: bool = True) -> int:
         """Compress video with quality settings.
 
         Args:
             input_file: Input video file
             output_file: Output file (default: input_compressed.ext)
             crf: CRF value (18-28, lower=better quality)
-            preset: Encoding preset (ultrafast, fast, medium, slow, veryslow)
+            preset: Encoding preset (ultrafast, faster, fast, medium, slow, veryslow)
+            hw: Allow hardware encoders when available
 
         Returns:
             Exit code (0 for success)
         """
-        import ffmpeg
-
-        input_path = Path(input_file).expanduser().resolve()
+        # Stat once: covers the existence check and the size report below
+        input_path, input_stat = _resolve_and_stat(input_file)
 
-        if not input_path.exists():
+        if input_stat is None:
             print(f"✗ Error: Input file not found: {input_file}", file=sys.stderr)
             return 1
 
@@ -163,7 +490,7 @@ class CLI:
         if output_file is None:
             output_path = input_path.parent / f"{input_path.stem}_compressed{input_path.suffix}"
         else:
-            output_path = Path(output_file).expanduser().resolve()
+            output_path = Path(output_file).expanduser()
 
         print(f"🗜️  Compress: {input_path.name}")
         print(f"  CRF:    {crf} (lower=better quality)")
@@ -171,23 +498,58 @@ class CLI:
 
         try:
             stream = ffmpeg.input(str(input_path))
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                vcodec='libx264',
-                crf=crf,
-                preset=preset,
-                acodec='aac'
-            )
-
-            # Show ffmpeg command
-            cmd = ' '.join(ffmpeg.compile(stream))
-            print(f"\n▶ Running: ffmpeg {cmd.split('ffmpeg')[1] if 'ffmpeg' in cmd else cmd}")
-
-            ffmpeg.run(stream, overwrite_output=True)
-
-            input_size = input_path.stat().st_size / (1024*1024)
-            output_size = output_path.stat().st_size / (1024*1024)
+
+            mux_opts = _mux_opts(output_path)
+            encoder = _detect_hw_encoder() if hw else None
+
+            if encoder == 'h264_nvenc':
+                # Offload the encode to the GPU; map CRF onto NVENC's
+                # constant-quality mode and the preset onto p1-p7.
+                print(f"  Encoder: h264_nvenc (hardware)")
+                stream = ffmpeg.output(
+                    stream,
+                    str(output_path),
+                    vcodec='h264_nvenc',
+                    preset=NVENC_PRESET_MAP.get(preset, 'p4'),
+                    rc='vbr',
+                    cq=crf,
+                    video_bitrate=0,  # let cq govern quality, not a bitrate cap
+                    acodec='aac',
+                    **mux_opts
+                )
+            elif encoder == 'h264_qsv':
+                # QSV's ICQ quality scale runs roughly double the CRF range
+                print(f"  Encoder: h264_qsv (hardware)")
+                stream = ffmpeg.output(
+                    stream,
+                    str(output_path),
+                    vcodec='h264_qsv',
+                    global_quality=crf * 2,
+                    preset=preset,
+                    acodec='aac',
+                    **mux_opts
+                )
+            else:
+                x264_opts = {}
+                asm = _x264_asm_params()
+                if asm:
+                    x264_opts['x264-params'] = asm
+
+                stream = ffmpeg.output(
+                    stream,
+                    str(output_path),
+                    vcodec='libx264',
+                    crf=crf,
+                    preset=preset,
+                    acodec='aac',
+                    **x264_opts,
+                    **mux_opts
+                )
+
+            _run_ffmpeg(stream, _probe_duration(input_path))
+
+            input_size = input_stat.st_size * _INV_MB
+            output_size = output_path.stat().st_size * _INV_MB
             reduction = ((input_size - output_size) / input_size) * 100
 
             print(f"\n✓ Compression complete!")
@@ -217,11 +579,9 @@ class CLI:
         Returns:
             Exit code (0 for success)
         """
-        import ffmpeg
+        input_path, input_stat = _resolve_and_stat(input_file)
 
-        input_path = Path(input_file).expanduser().resolve()
-
-        if not input_path.exists():
+        if input_stat is None:
             print(f"✗ Error: Input file not found: {input_file}", file=sys.stderr)
             return 1
 
@@ -229,7 +589,7 @@ class CLI:
         if output_file is None:
             output_path = input_path.parent / f"{input_path.stem}.{format}"
         else:
-            output_path = Path(output_file).expanduser().resolve()
+            output_path = Path(output_file).expanduser()
 
         print(f"🎵 Extract Audio: {input_path.name}")
         print(f"  Format:  {format}")
@@ -238,31 +598,33 @@ class CLI:
         try:
             stream = ffmpeg.input(str(input_path))
 
-            # Map audio codec based on format
-            codec_map = {
-                'mp3': 'libmp3lame',
-                'm4a': 'aac',
-                'flac': 'flac',
-                'wav': 'pcm_s16le'
-            }
-
-            acodec = codec_map.get(format, 'libmp3lame')
-
-            stream = ffmpeg.output(
-                stream,
-                str(output_path),
-                acodec=acodec,
-                audio_bitrate=quality,
-                vn=None  # No video
-            )
+            if _source_audio_codec(input_path) == AUDIO_COPY_CODECS.get(format):
+                # Source audio already matches the target codec: remux it
+                # without the decode/encode roundtrip
+                print(f"  Copy:    source audio already matches, skipping re-encode")
+                stream = ffmpeg.output(
+                    stream,
+                    str(output_path),
+                    acodec='copy',
+                    vn=None,  # No video
+                    **_mux_opts(output_path)
+                )
+            else:
+                # Map audio codec based on format
+                acodec = AUDIO_ENCODERS.get(format, 'libmp3lame')
 
-            # Show ffmpeg command
-            cmd = ' '.join(ffmpeg.compile(stream))
-            print(f"\n▶ Running: ffmpeg {cmd.split('ffmpeg')[1] if 'ffmpeg' in cmd else cmd}")
+                stream = ffmpeg.output(
+                    stream,
+                    str(output_path),
+                    acodec=acodec,
+                    audio_bitrate=quality,
+                    vn=None,  # No video
+                    **_mux_opts(output_path)
+                )
 
-            ffmpeg.run(stream, overwrite_output=True)
+            _run_ffmpeg(stream, _probe_duration(input_path))
 
-            output_size = output_path.stat().st_size / (1024*1024)
+            output_size = output_path.stat().st_size * _INV_MB
             print(f"\n✓ Audio extraction complete!")
             print(f"  Output: {output_path}")
             print(f"  Size:   {output_size:.1f} MB")
@@ -290,11 +652,9 @@ class CLI:
         Returns:
             Exit code (0 for success)
         """
-        import ffmpeg
-
-        input_path = Path(input_file).expanduser().resolve()
+        input_path, input_stat = _resolve_and_stat(input_file)
 
-        if not input_path.exists():
+        if input_stat is None:
             print(f"✗ Error: Input file not found: {input_file}", file=sys.stderr)
             return 1
 
@@ -306,7 +666,7 @@ class CLI:
         if output_file is None:
             output_path = input_path.parent / f"{input_path.stem}_trimmed{input_path.suffix}"
         else:
-            output_path = Path(output_file).expanduser().resolve()
+            output_path = Path(output_file).expanduser()
 
         print(f"✂️  Trim: {input_path.name}")
         print(f"  Start: {start}")
@@ -316,22 +676,35 @@ class CLI:
             print(f"  Duration: {duration}")
 
         try:
-            stream = ffmpeg.input(str(input_path), ss=start)
+            # Trim is always a stream copy with a fixed argv shape, so
+            # skip ffmpeg-python's graph builder entirely. Seek on the
+            # input side (with -noaccurate_seek so the demuxer lands on
+            # the nearest keyframe instead of decoding forward), then
+            # bound the copy with an explicit duration: 'to' measured
+            # against input timestamps combined with input seeking
+            # makes ffmpeg re-scan the demuxed stream.
+            argv = ['ffmpeg', *_PROGRESS_ARGS, '-y',
+                    '-noaccurate_seek', '-ss', start, '-i', str(input_path)]
 
             if end:
-                stream = ffmpeg.output(stream, str(output_path), to=end, codec='copy')
+                span = _parse_timestamp(end) - _parse_timestamp(start)
+                if span <= 0:
+                    print(f"✗ Error: End time must be after start time", file=sys.stderr)
+                    return 1
+                argv += ['-t', str(span)]
             elif duration:
-                stream = ffmpeg.output(stream, str(output_path), t=duration, codec='copy')
+                span = _parse_timestamp(duration)
+                argv += ['-t', duration]
             else:
-                stream = ffmpeg.output(stream, str(output_path), codec='copy')
+                total = _probe_duration(input_path)
+                span = max(total - _parse_timestamp(start), 0.0) if total else None
 
-            # Show ffmpeg command
-            cmd = ' '.join(ffmpeg.compile(stream))
-            print(f"\n▶ Running: ffmpeg {cmd.split('ffmpeg')[1] if 'ffmpeg' in cmd else cmd}")
+            argv += ['-c', 'copy', '-avoid_negative_ts', 'make_zero',
+                     str(output_path)]
 
-            ffmpeg.run(stream, overwrite_output=True)
+            _run_ffmpeg_argv(argv, span)
 
-            output_size = output_path.stat().st_size / (1024*1024)
+            output_size = output_path.stat().st_size * _INV_MB
             print(f"\n✓ Trim complete!")
             print(f"  Output: {output_path}")
             print(f"  Size:   {output_size:.1f} MB")
@@ -1,6 +1,7 @@
 """Configuration management for fftpeg."""
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -48,6 +49,33 @@ DEFAULT_CONFIG = {
     ]
 }
 
+# Defaults frozen as a JSON string: json.loads hands every Config a
+# fresh deep copy, so instances never share nested dicts with the
+# module-level template (a shallow .copy() did, and a json round-trip
+# beats copy.deepcopy for a small nested dict)
+_FROZEN_DEFAULTS = json.dumps(DEFAULT_CONFIG)
+
+
+def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge overrides into base.
+
+    A plain dict.update would replace whole sub-dicts, wiping sibling
+    keys under e.g. source_formats when the user file only sets one.
+
+    Args:
+        base: Dict merged into (mutated in place)
+        overrides: Values taking precedence
+
+    Returns:
+        The merged base dict
+    """
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
 
 class Config:
     """Configuration manager for fftpeg."""
@@ -64,32 +92,69 @@ class Config:
             config_path = config_dir / "config.json"
 
         self.config_path = config_path
+        self._dirty = False
         self.config = self._load_config()
+        self._flat = self._build_flat()
+        self._org_paths: Optional[Dict[str, Path]] = None
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
+        config = json.loads(_FROZEN_DEFAULTS)
+
         if self.config_path.exists():
             try:
                 with open(self.config_path, 'r') as f:
                     loaded = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    config = DEFAULT_CONFIG.copy()
-                    config.update(loaded)
-                    return config
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Error loading config: {e}. Using defaults.")
-                return DEFAULT_CONFIG.copy()
-        else:
-            # Create default config
-            config = DEFAULT_CONFIG.copy()
-            self.save()
-            return config
+                return config
+            # Merge with defaults to ensure all keys exist
+            return _deep_merge(config, loaded)
+
+        # First run: persist the defaults
+        self.config = config
+        self.save()
+        return config
 
     def save(self):
-        """Save current configuration to file."""
+        """Save current configuration to file.
+
+        Writes to a temp file and renames it into place so a crash
+        mid-write can never leave a torn config behind.
+        """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
+        tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
             json.dump(self.config, f, indent=2)
+        os.replace(tmp_path, self.config_path)
+        self._dirty = False
+
+    def __enter__(self):
+        """Enter a batching context; changes are flushed once on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Flush any pending changes made inside the context."""
+        if self._dirty:
+            self.save()
+
+    def _build_flat(self) -> Dict[str, Any]:
+        """Flatten the config into dotted keys for O(1) lookups.
+
+        Returns:
+            Dict mapping dotted key paths to values
+        """
+        flat = {}
+
+        def walk(prefix: str, node: Dict[str, Any]):
+            for k, v in node.items():
+                dotted = prefix + k
+                flat[dotted] = v
+                if isinstance(v, dict):
+                    walk(dotted + '.', v)
+
+        walk('', self.config)
+        return flat
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -101,20 +166,15 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any):
         """Set a configuration value.
 
+        Marks the config dirty instead of rewriting the file per call;
+        persist with save(), or use the instance as a context manager to
+        flush a batch of changes in one write.
+
         Args:
             key: Configuration key (supports dot notation)
             value: Value to set
@@ -130,7 +190,9 @@ class Config:
 
         # Set the value
         config[keys[-1]] = value
-        self.save()
+        self._flat = self._build_flat()
+        self._org_paths = None
+        self._dirty = True
 
     def get_download_path(self) -> Path:
         """Get the download path as a Path object.
@@ -156,16 +218,21 @@ class Config:
     def get_organization_paths(self) -> Dict[str, Path]:
         """Get paths for organization structures.
 
+        The Path objects are built once and cached; changing
+        download_path via set() invalidates the cache.
+
         Returns:
             Dict with keys: base, by_source, by_tag, by_date
         """
-        base = self.get_download_path()
-        return {
-            "base": base,
-            "by_source": base.parent / "by-source",
-            "by_tag": base.parent / "by-tag",
-            "by_date": base.parent / "by-date"
-        }
+        if self._org_paths is None:
+            base = self.get_download_path()
+            self._org_paths = {
+                "base": base,
+                "by_source": base.parent / "by-source",
+                "by_tag": base.parent / "by-tag",
+                "by_date": base.parent / "by-date"
+            }
+        return self._org_paths
 
     def get_auto_tag_rules(self) -> list:
         """Get enabled auto-tag rules.
@@ -192,9 +259,10 @@ class Config:
                 self.save()
                 return
 
-        # Add new rule
-        rules.append({"source": source, "tag": tag, "enabled": True})
-        self.config["auto_tag_rules"] = rules
+        # Add new rule; route the assignment through set() so the flat
+        # lookup table sees the rebound list
+        rules = rules + [{"source": source, "tag": tag, "enabled": True}]
+        self.set("auto_tag_rules", rules)
         self.save()
 
     def remove_auto_tag_rule(self, source: str, tag: str):
@@ -206,5 +274,6 @@ class Config:
         """
         rules = self.config.get("auto_tag_rules", [])
         rules = [r for r in rules if not (r["source"] == source and r["tag"] == tag)]
-        self.config["auto_tag_rules"] = rules
+        # Route through set() so the flat lookup table sees the new list
+        self.set("auto_tag_rules", rules)
         self.save()
@@ -4,8 +4,6 @@
 import sys
 import argparse
 from pathlib import Path
-from .app import FFTpegApp
-from .cli import CLI
 
 
 def main():
@@ -42,9 +40,11 @@ def main():
     compress_parser.add_argument('-o', '--output', help='Output file (default: input_compressed.ext)')
     compress_parser.add_argument('--crf', type=int, default=23,
                                 help='CRF value 18-28 (lower=better quality, default: 23)')
-    compress_parser.add_argument('--preset', default='medium',
-                                choices=['ultrafast', 'fast', 'medium', 'slow', 'veryslow'],
-                                help='Encoding preset (default: medium)')
+    compress_parser.add_argument('--preset', default='faster',
+                                choices=['ultrafast', 'faster', 'fast', 'medium', 'slow', 'veryslow'],
+                                help='Encoding preset (default: faster)')
+    compress_parser.add_argument('--no-hw', action='store_true',
+                                help='Force software (libx264) encoding')
 
     # Extract audio command
     audio_parser = subparsers.add_parser('extract-audio', help='Extract audio from video',
@@ -83,6 +83,9 @@ def main():
 
     # Handle commands
     if args.command:
+        # Deferred so one-shot commands never import the Textual stack
+        from .cli import CLI
+
         cli = CLI()
 
         if args.command == 'pull':
@@ -92,7 +95,8 @@ def main():
             return cli.convert(args.input, args.output, args.codec)
 
         elif args.command == 'compress':
-            return cli.compress(args.input, args.output, args.crf, args.preset)
+            return cli.compress(args.input, args.output, args.crf, args.preset,
+                                hw=not args.no_hw)
 
         elif args.command in ['extract-audio', 'audio']:
             return cli.extract_audio(args.input, args.output, args.format, args.quality)
@@ -113,6 +117,8 @@ def main():
             sys.exit(1)
 
         # Run the TUI app
+        from .app import FFTpegApp
+
         app = FFTpegApp(start_path=path)
         app.run()
 
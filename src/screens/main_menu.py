@@ -1,129 +1,138 @@
 """Main menu screen with file browser."""
 
+from collections import OrderedDict
 from pathlib import Path
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, DirectoryTree
 from textual.containers import Container, Vertical, Horizontal
 from textual.binding import Binding
 
+from ..utils.formatting import format_size
 
-class VideoDirectoryTree(DirectoryTree):
-    """A directory tree that filters for video files."""
 
-    VIDEO_EXTENSIONS = {
-        ".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm",
-        ".m4v", ".mpg", ".mpeg", ".3gp", ".ogv", ".ts", ".m2ts"
-    }
+# Static panel content, built once at import instead of per compose
+_WELCOME_MESSAGE = """[b cyan]Welcome to fftpeg! 🎬[/b cyan]
 
-    def filter_paths(self, paths):
-        """Filter to show only directories and video files."""
-        return [
-            path for path in paths
-            if path.is_dir() or path.suffix.lower() in self.VIDEO_EXTENSIONS
-        ]
+[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
 
+[dim]Navigate the file browser with[/dim]
+[dim]arrow keys and select a video[/dim]
+[dim]file to get started.[/dim]
 
-class MainMenuScreen(Screen):
-    """The main menu screen with file browser."""
+[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
 
-    CSS = """
-    MainMenuScreen {
-        layout: grid;
-        grid-size: 2 1;
-        grid-columns: 3fr 2fr;
-    }
+[dim italic]⚡ Available Operations:[/dim italic]
 
-    #file-browser {
-        border: thick $primary;
-        border-title-align: center;
-        height: 100%;
-        padding: 1;
-        background: $surface;
-    }
+  [bold green]U[/bold green] → Pull from URL ⭐
+  [bold cyan]C[/bold cyan] → Convert format
+  [bold cyan]P[/bold cyan] → Compress video
+  [bold cyan]A[/bold cyan] → Extract audio
 
-    #info-panel {
-        border: thick $secondary;
-        border-title-align: center;
-        height: 100%;
-        padding: 1;
-        background: $surface;
-    }
+[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
 
-    DirectoryTree {
-        height: 100%;
-        background: $surface;
-    }
+[dim]Press [bold]Q[/bold] to quit[/dim]
+[dim]Press [bold]?[/bold] for help[/dim]
+"""
 
-    DirectoryTree > .tree--guides {
-        color: $primary-lighten-2;
-    }
+# Static fragments of the info panel, parsed by Rich once at import;
+# update_file_info stitches them together with the per-file values so
+# the markup parser never runs on the selection path
+_INFO_DIVIDER = Text.from_markup("\n[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]\n\n")
+_INFO_SIZE_LABEL = Text.from_markup("[dim]📦 Size:[/dim]       ")
+_INFO_FORMAT_LABEL = Text.from_markup("[dim]🎬 Format:[/dim]     ")
+_INFO_LOCATION_LABEL = Text.from_markup("[dim]📂 Location:[/dim]   ")
+_INFO_ACTIONS = Text.from_markup(
+    "[dim italic]⚡ Quick Actions:[/dim italic]\n\n"
+    "  [bold cyan]C[/bold cyan] → Convert format\n"
+    "  [bold cyan]P[/bold cyan] → Compress video\n"
+    "  [bold cyan]A[/bold cyan] → Extract audio\n"
+    "  [bold cyan]T[/bold cyan] → Trim video"
+)
+
+
+def _build_info_text(name: str, size: str, ext: str, parent: str) -> Text:
+    """Assemble the info panel for a file selection.
+
+    Args:
+        name: File name
+        size: Human-readable size
+        ext: Upper-cased extension
+        parent: Parent directory name
+
+    Returns:
+        Rich Text ready to hand to the info widget
+    """
+    text = Text()
+    text.append(name, "bold cyan")
+    text.append("\n")
+    text.append_text(_INFO_DIVIDER)
+    text.append_text(_INFO_SIZE_LABEL)
+    text.append(size, "green bold")
+    text.append("\n")
+    text.append_text(_INFO_FORMAT_LABEL)
+    text.append(ext, "green bold")
+    text.append("\n")
+    text.append_text(_INFO_LOCATION_LABEL)
+    text.append(parent + "/", "blue")
+    text.append("\n")
+    text.append_text(_INFO_DIVIDER)
+    text.append_text(_INFO_ACTIONS)
+    text.append("\n")
+    text.append_text(_INFO_DIVIDER)
+    return text
 
-    DirectoryTree:focus {
-        border: tall $accent;
-    }
 
-    .info-title {
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-        text-align: center;
-        background: $primary-darken-2;
-        padding: 1;
-    }
+class VideoDirectoryTree(DirectoryTree):
+    """A directory tree that filters for video files."""
 
-    .info-content {
-        padding: 1 2;
-        color: $text;
-    }
+    VIDEO_EXTENSIONS = frozenset({
+        ".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm",
+        ".m4v", ".mpg", ".mpeg", ".3gp", ".ogv", ".ts", ".m2ts"
+    })
 
-    .info-label {
-        color: $text-muted;
-        width: 15;
-    }
+    # Tuple form for str.endswith, which checks all alternatives in C
+    _VIDEO_ENDSWITH = tuple(VIDEO_EXTENSIONS)
 
-    .info-value {
-        color: $success;
-        text-style: bold;
-    }
+    def filter_paths(self, paths):
+        """Filter to show only directories and video files."""
+        # Check the name first: endswith on a tuple is a pure string
+        # test, while is_dir() costs a stat() syscall per path. In a
+        # directory full of videos most entries never reach the stat.
+        allowed = self._VIDEO_ENDSWITH
+        return [
+            path for path in paths
+            if path.name.lower().endswith(allowed) or path.is_dir()
+        ]
 
-    .welcome-box {
-        border: solid $accent;
-        background: $boost;
-        padding: 1 2;
-        margin: 1 0;
-    }
 
-    .operation-hint {
-        color: $warning;
-        text-style: italic;
-        margin-top: 1;
-    }
+class MainMenuScreen(Screen):
+    """The main menu screen with file browser."""
 
-    .file-name {
-        color: $accent;
-        text-style: bold;
-        text-align: center;
-        padding: 1;
-        background: $primary-darken-3;
-    }
+    CSS_PATH = "main_menu.tcss"
 
-    .stat-row {
-        margin: 0 0 0 2;
-    }
-    """
+    _STAT_CACHE_MAX = 128
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("u", "pull", "Pull URL", show=True),
-        Binding("c", "convert", "Convert", show=True),
-        Binding("p", "compress", "Compress", show=True),
-        Binding("a", "audio", "Audio", show=True),
-        Binding("t", "trim", "Trim", show=False),
-        Binding("r", "rename", "Rename", show=False),
-        Binding("d", "dedupe", "Dedupe", show=False),
-        Binding("s", "settings", "Settings", show=False),
+        Binding("c", "operation('convert')", "Convert", show=True),
+        Binding("p", "operation('compress')", "Compress", show=True),
+        Binding("a", "operation('audio')", "Audio", show=True),
+        Binding("t", "operation('trim')", "Trim", show=False),
+        Binding("r", "todo('Rename')", "Rename", show=False),
+        Binding("d", "todo('Dedupe')", "Dedupe", show=False),
+        Binding("s", "todo('Settings')", "Settings", show=False),
         Binding("q", "quit", "Quit", show=True),
-    ]
+    )
+
+    # Operation key -> screen class name in operation_screen
+    _OPERATION_SCREENS = {
+        "convert": "ConvertScreen",
+        "compress": "CompressScreen",
+        "audio": "AudioScreen",
+        "trim": "TrimScreen",
+    }
 
     def __init__(self, start_path: Path):
         """Initialize the main menu screen.
@@ -134,31 +143,31 @@ class MainMenuScreen(Screen):
         super().__init__()
         self.start_path = start_path
         self.selected_file = None
+        self._info_widget = None
+        self._pending_path = None
+        self._debounce_timer = None
+        # LRU of stat results so revisiting a file skips the syscall
+        # (which can stall the event loop on network filesystems)
+        self._stat_cache = OrderedDict()
+        self._last_rendered_path = None
+
+    def on_mount(self) -> None:
+        """Resolve widget references once instead of per update."""
+        self._info_widget = self.query_one("#file-info", Static)
+        # Let the first frame paint before the tree starts enumerating
+        # the start directory, which can take a while on big folders
+        self.call_after_refresh(self._mount_tree)
+
+    def _mount_tree(self) -> None:
+        """Swap the placeholder for the real directory tree."""
+        self.query_one("#browser-placeholder", Static).remove()
+        tree = VideoDirectoryTree(str(self.start_path))
+        self.query_one("#file-browser", Container).mount(tree)
+        tree.focus()
 
     def _get_welcome_message(self) -> str:
         """Get the welcome message for the info panel."""
-        return """[b cyan]Welcome to fftpeg! 🎬[/b cyan]
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-
-[dim]Navigate the file browser with[/dim]
-[dim]arrow keys and select a video[/dim]
-[dim]file to get started.[/dim]
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-
-[dim italic]⚡ Available Operations:[/dim italic]
-
-  [bold green]U[/bold green] → Pull from URL ⭐
-  [bold cyan]C[/bold cyan] → Convert format
-  [bold cyan]P[/bold cyan] → Compress video
-  [bold cyan]A[/bold cyan] → Extract audio
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-
-[dim]Press [bold]Q[/bold] to quit[/dim]
-[dim]Press [bold]?[/bold] for help[/dim]
-"""
+        return _WELCOME_MESSAGE
 
     def compose(self) -> ComposeResult:
         """Compose the main menu screen."""
@@ -166,7 +175,7 @@ class MainMenuScreen(Screen):
 
         with Container(id="file-browser"):
             yield Static("📁 File Browser", classes="info-title")
-            yield VideoDirectoryTree(str(self.start_path))
+            yield Static("Loading file browser…", id="browser-placeholder")
 
         with Container(id="info-panel"):
             yield Static("ℹ️  File Information", classes="info-title")
@@ -179,9 +188,23 @@ class MainMenuScreen(Screen):
         yield Footer()
 
     def on_directory_tree_file_selected(self, event: DirectoryTree.FileSelected) -> None:
-        """Handle file selection in the directory tree."""
+        """Handle file selection in the directory tree.
+
+        Holding an arrow key fires one event per step; the info panel
+        only renders the selection that survives a short quiet period,
+        so traversal costs one stat and redraw instead of one per step.
+        """
         self.selected_file = event.path
-        self.update_file_info(event.path)
+        self._pending_path = event.path
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        self._debounce_timer = self.set_timer(0.08, self._flush_selection)
+
+    def _flush_selection(self) -> None:
+        """Render the most recent selection once input has settled."""
+        self._debounce_timer = None
+        if self._pending_path is not None:
+            self.update_file_info(self._pending_path)
 
     def update_file_info(self, file_path: Path) -> None:
         """Update the file information panel.
@@ -189,90 +212,64 @@ class MainMenuScreen(Screen):
         Args:
             file_path: The selected file path
         """
-        info_widget = self.query_one("#file-info", Static)
+        # Arrowing away and back lands on the same file; the panel
+        # already shows it, so skip the stat and re-render
+        if file_path == self._last_rendered_path:
+            return
+
+        info_widget = self._info_widget
+        if info_widget is None:
+            info_widget = self._info_widget = self.query_one("#file-info", Static)
 
         # Get basic file stats
-        stat = file_path.stat()
-        size_mb = stat.st_size / (1024 * 1024)
-
-        # Format size nicely
-        if size_mb < 1:
-            size_str = f"{stat.st_size / 1024:.1f} KB"
-        elif size_mb < 1024:
-            size_str = f"{size_mb:.1f} MB"
+        stat = self._stat_cache.get(file_path)
+        if stat is None:
+            stat = file_path.stat()
+            self._stat_cache[file_path] = stat
+            if len(self._stat_cache) > self._STAT_CACHE_MAX:
+                self._stat_cache.popitem(last=False)
         else:
-            size_str = f"{size_mb / 1024:.2f} GB"
+            self._stat_cache.move_to_end(file_path)
+        size_str = format_size(stat.st_size)
 
-        info_text = f"""[b cyan]{file_path.name}[/b cyan]
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-
-[dim]📦 Size:[/dim]       [green bold]{size_str}[/green bold]
-[dim]🎬 Format:[/dim]     [green bold]{file_path.suffix[1:].upper()}[/green bold]
-[dim]📂 Location:[/dim]   [blue]{file_path.parent.name}/[/blue]
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-
-[dim italic]⚡ Quick Actions:[/dim italic]
-
-  [bold cyan]C[/bold cyan] → Convert format
-  [bold cyan]P[/bold cyan] → Compress video
-  [bold cyan]A[/bold cyan] → Extract audio
-  [bold cyan]T[/bold cyan] → Trim video
-
-[yellow]━━━━━━━━━━━━━━━━━━━━━━━[/yellow]
-"""
-
-        info_widget.update(info_text)
+        info_widget.update(_build_info_text(
+            file_path.name,
+            size_str,
+            file_path.suffix[1:].upper(),
+            file_path.parent.name
+        ))
+        self._last_rendered_path = file_path
 
     def action_pull(self) -> None:
         """Handle pull URL action."""
         from .pull_screen import PullScreen
         self.app.push_screen(PullScreen())
 
-    def action_convert(self) -> None:
-        """Handle convert action."""
-        if self.selected_file:
-            from .operation_screen import ConvertScreen
-            self.app.push_screen(ConvertScreen(self.selected_file))
-        else:
-            self.app.notify("Please select a file first", severity="warning")
+    def action_operation(self, name: str) -> None:
+        """Open the operation screen for the selected file.
 
-    def action_compress(self) -> None:
-        """Handle compress action."""
-        if self.selected_file:
-            from .operation_screen import CompressScreen
-            self.app.push_screen(CompressScreen(self.selected_file))
-        else:
-            self.app.notify("Please select a file first", severity="warning")
+        All four file operations share the select-check/notify pattern,
+        so the bindings route here with an argument instead of through
+        near-identical per-operation methods.
 
-    def action_audio(self) -> None:
-        """Handle audio extraction action."""
-        if self.selected_file:
-            from .operation_screen import AudioScreen
-            self.app.push_screen(AudioScreen(self.selected_file))
-        else:
-            self.app.notify("Please select a file first", severity="warning")
-
-    def action_trim(self) -> None:
-        """Handle trim action."""
-        if self.selected_file:
-            from .operation_screen import TrimScreen
-            self.app.push_screen(TrimScreen(self.selected_file))
-        else:
+        Args:
+            name: Operation key from _OPERATION_SCREENS
+        """
+        if self.selected_file is None:
             self.app.notify("Please select a file first", severity="warning")
+            return
 
-    def action_rename(self) -> None:
-        """Handle rename action."""
-        self.app.notify("Rename feature coming soon!", severity="information")
+        from . import operation_screen
+        screen_cls = getattr(operation_screen, self._OPERATION_SCREENS[name])
+        self.app.push_screen(screen_cls(self.selected_file))
 
-    def action_dedupe(self) -> None:
-        """Handle dedupe action."""
-        self.app.notify("Dedupe feature coming soon!", severity="information")
+    def action_todo(self, feature: str) -> None:
+        """Notify that a planned feature is not implemented yet.
 
-    def action_settings(self) -> None:
-        """Handle settings action."""
-        self.app.notify("Settings coming soon!", severity="information")
+        Args:
+            feature: Human-readable feature name
+        """
+        self.app.notify(f"{feature} feature coming soon!", severity="information")
 
     def action_quit(self) -> None:
         """Quit the application."""
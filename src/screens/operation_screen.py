@@ -69,9 +69,9 @@ class OperationScreen(Screen):
     .error-text { color: $error; text-style: bold; }
     """
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel", show=True),
-    ]
+    )
 
     def action_cancel(self) -> None:
         self.app.pop_screen()
@@ -95,7 +95,7 @@ class CompressScreen(OperationScreen):
                 yield Static("CRF (18=high quality, 28=small file):", classes="input-label")
                 yield Input(value="23", id="crf-input")
                 yield Static("Preset:", classes="input-label")
-                yield Input(value="medium", id="preset-input")
+                yield Input(value="faster", id="preset-input")
                 with Horizontal(classes="button-row"):
                     yield Button("Compress", variant="primary", id="run-btn")
                     yield Button("Cancel", variant="error", id="cancel-btn")
@@ -112,7 +112,7 @@ class CompressScreen(OperationScreen):
         status = self.query_one("#status-box", Container)
         output = self.query_one("#output-input", Input).value.strip() or None
         crf = int(self.query_one("#crf-input", Input).value.strip() or "23")
-        preset = self.query_one("#preset-input", Input).value.strip() or "medium"
+        preset = self.query_one("#preset-input", Input).value.strip() or "faster"
 
         status.update(Static("⏳ Compressing...", classes="status-text"))
         try:
@@ -101,9 +101,9 @@ class PullScreen(Screen):
     }
     """
 
-    BINDINGS = [
+    BINDINGS = (
         Binding("escape", "cancel", "Cancel", show=True),
-    ]
+    )
 
     def __init__(self):
         """Initialize pull screen."""
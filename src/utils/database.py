@@ -1,5 +1,6 @@
 """Database utilities for managing downloads, tags, and metadata."""
 
+import json
 import sqlite3
 from pathlib import Path
 from datetime import datetime
@@ -92,6 +93,17 @@ class Database:
                 )
             """)
 
+            # Cached ffprobe output, keyed by file identity so edits
+            # or replacements invalidate the entry
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS probe_cache (
+                    filepath TEXT PRIMARY KEY,
+                    mtime REAL,
+                    size INTEGER,
+                    probe_json TEXT
+                )
+            """)
+
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_source ON downloads(source)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloads_hash ON downloads(hash)")
@@ -263,6 +275,43 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_probe(self, filepath: Path, mtime: float, size: int) -> Optional[Dict]:
+        """Get cached ffprobe output for a file.
+
+        Args:
+            filepath: Path the probe was taken for
+            mtime: File modification time when the probe was stored
+            size: File size when the probe was stored
+
+        Returns:
+            Parsed probe dict, or None if missing or stale
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT probe_json FROM probe_cache
+                WHERE filepath = ? AND mtime = ? AND size = ?
+            """, (str(filepath), mtime, size))
+            row = cursor.fetchone()
+            return json.loads(row['probe_json']) if row else None
+
+    def set_probe(self, filepath: Path, mtime: float, size: int, probe: Dict):
+        """Store ffprobe output for a file, replacing any stale entry.
+
+        Args:
+            filepath: Path the probe was taken for
+            mtime: Current file modification time
+            size: Current file size
+            probe: Raw ffprobe dict to cache
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO probe_cache (filepath, mtime, size, probe_json)
+                VALUES (?, ?, ?, ?)
+            """, (str(filepath), mtime, size, json.dumps(probe)))
+            conn.commit()
+
     def get_files_by_tag(self, tag_name: str) -> List[Dict]:
         """Get all files with a specific tag.
 
@@ -128,6 +128,8 @@ class VideoDownloader:
             'outtmpl': str(download_path / '%(title)s.%(ext)s'),
             'quiet': False,
             'no_warnings': False,
+            # Fetch HLS/DASH fragments in parallel instead of one at a time
+            'concurrent_fragment_downloads': 8,
         }
 
         # Add merge output format if specified
@@ -0,0 +1,22 @@
+"""Shared formatting helpers."""
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def format_size(size: int) -> str:
+    """Format a byte count as a human-readable string.
+
+    Picks the unit from the bit length of the size instead of dividing
+    in a loop, so formatting is a single shift and divide.
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        Human-readable size string (e.g., "12.3 MB")
+    """
+    if size < 1024:
+        return f"{size} B"
+
+    shift = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (shift * 10)):.1f} {_SIZE_UNITS[shift]}"
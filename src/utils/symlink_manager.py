@@ -158,13 +158,18 @@ class SymlinkManager:
             if not dir_path.exists():
                 continue
 
-            for item in dir_path.rglob("*"):
-                if item.is_symlink() and not item.exists():
-                    try:
-                        item.unlink()
-                        print(f"Removed broken symlink: {item}")
-                    except OSError as e:
-                        print(f"Error removing {item}: {e}")
+            # os.walk batches readdir results and hands back plain
+            # strings, where rglob("*") builds a Path object and extra
+            # stat calls for every entry in the tree.
+            for root, _dirs, files in os.walk(dir_path):
+                for name in files:
+                    item = os.path.join(root, name)
+                    if os.path.islink(item) and not os.path.exists(item):
+                        try:
+                            os.unlink(item)
+                            print(f"Removed broken symlink: {item}")
+                        except OSError as e:
+                            print(f"Error removing {item}: {e}")
 
     def get_organization_stats(self) -> Dict[str, Dict]:
         """Get statistics about organized files.
@@ -174,32 +179,28 @@ class SymlinkManager:
         """
         stats = {}
 
+        # os.scandir reuses the metadata returned by readdir, so counting
+        # symlinks does not re-stat every entry the way iterdir() would.
+        def count_dir_symlinks(parent: Path) -> Dict[str, int]:
+            counts = {}
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as links:
+                            counts[entry.name] = sum(1 for link in links if link.is_symlink())
+            return counts
+
         # Source stats
         if self.by_source_path.exists():
-            sources = {}
-            for source_dir in self.by_source_path.iterdir():
-                if source_dir.is_dir():
-                    count = sum(1 for _ in source_dir.iterdir() if _.is_symlink())
-                    sources[source_dir.name] = count
-            stats['by_source'] = sources
+            stats['by_source'] = count_dir_symlinks(self.by_source_path)
 
         # Tag stats
         if self.by_tag_path.exists():
-            tags = {}
-            for tag_dir in self.by_tag_path.iterdir():
-                if tag_dir.is_dir():
-                    count = sum(1 for _ in tag_dir.iterdir() if _.is_symlink())
-                    tags[tag_dir.name] = count
-            stats['by_tag'] = tags
+            stats['by_tag'] = count_dir_symlinks(self.by_tag_path)
 
         # Date stats
         if self.by_date_path.exists():
-            dates = {}
-            for date_dir in self.by_date_path.iterdir():
-                if date_dir.is_dir():
-                    count = sum(1 for _ in date_dir.iterdir() if _.is_symlink())
-                    dates[date_dir.name] = count
-            stats['by_date'] = dates
+            stats['by_date'] = count_dir_symlinks(self.by_date_path)
 
         return stats
 
@@ -217,9 +218,10 @@ class SymlinkManager:
             return []
 
         files = []
-        for link in source_dir.iterdir():
-            if link.is_symlink() and link.exists():
-                files.append(link.resolve())
+        with os.scandir(source_dir) as links:
+            for link in links:
+                if link.is_symlink() and os.path.exists(link.path):
+                    files.append(Path(link.path).resolve())
 
         return files
 
@@ -237,8 +239,9 @@ class SymlinkManager:
             return []
 
         files = []
-        for link in tag_dir.iterdir():
-            if link.is_symlink() and link.exists():
-                files.append(link.resolve())
+        with os.scandir(tag_dir) as links:
+            for link in links:
+                if link.is_symlink() and os.path.exists(link.path):
+                    files.append(Path(link.path).resolve())
 
         return files